@@ -52,11 +52,12 @@ def build_model(name: str, config: Optional[ModelConfig] = None, **kwargs):
     Returns:
         A Model instance
     """
-    from .utils import list_available_models
+    from . import models  # noqa — importing the package populates the models registry (no-op once cached)
 
-    available_models = list_available_models()
-    if name not in available_models:
-        raise ValueError(f"Unknown model name: `{name}`!\nAvailable model names: {available_models}")
+    if name not in models_registry:
+        from .utils import list_available_models
+
+        raise ValueError(f"Unknown model name: `{name}`!\nAvailable model names: {list_available_models()}")
     config = config or models_registry[name].config_class()
     model = models_registry[name].module_class(config, **kwargs)
     return model
@@ -75,12 +76,13 @@ def build_preprocessor(name: str, config: Optional[PreprocessorConfig] = None, *
     Returns:
         A Preprocessor instance
     """
-    from .utils import list_available_preprocessors
+    from . import models, preprocessors  # noqa — some preprocessors live in model modules, import both
 
-    available_preprocessors = list_available_preprocessors()
     if name not in preprocessors_registry:
+        from .utils import list_available_preprocessors
+
         raise ValueError(
-            f"Unknown preprocessor name: `{name}`!\nAvailable preprocessor names: {available_preprocessors}"
+            f"Unknown preprocessor name: `{name}`!\nAvailable preprocessor names: {list_available_preprocessors()}"
         )
     config = config or preprocessors_registry[name].config_class()
     preprocessor = preprocessors_registry[name].module_class(config, **kwargs)
@@ -101,12 +103,13 @@ def build_dataset(name: str, config: Optional[DatasetConfig] = None, split: Spli
     Returns:
         A Dataset instance
     """
-    from .utils import list_available_datasets
+    from . import data  # noqa — importing the package populates the datasets registry (no-op once cached)
+
+    if name not in datasets_registry:
+        from .utils import list_available_datasets
 
-    available_datasets = list_available_datasets()
-    if name not in available_datasets:
         raise ValueError(
-            f"Unknown dataset name: `{name}`!\nAvailable dataset names: {available_datasets}"
+            f"Unknown dataset name: `{name}`!\nAvailable dataset names: {list_available_datasets()}"
         )
     config = config or datasets_registry[name].config_class()
     dataset = datasets_registry[name].module_class(config, split, **kwargs)
@@ -126,12 +129,13 @@ def build_embedding(name: str, config: Optional[EmbeddingConfig] = None, **kwarg
     Returns:
         A Embedding instance
     """
-    from .utils import list_available_embeddings
+    from . import embeddings  # noqa — importing the package populates the embeddings registry (no-op once cached)
+
+    if name not in embeddings_registry:
+        from .utils import list_available_embeddings
 
-    available_embeddings = list_available_embeddings()
-    if name not in available_embeddings:
         raise ValueError(
-            f"Unknown embedding name: `{name}`!\nAvailable embedding names: {available_embeddings}"
+            f"Unknown embedding name: `{name}`!\nAvailable embedding names: {list_available_embeddings()}"
         )
     config = config or embeddings_registry[name].config_class()
     embedding = embeddings_registry[name].module_class(config, **kwargs)
@@ -151,11 +155,12 @@ def build_metric(name: str, config: Optional[MetricConfig] = None, **kwargs):
     Returns:
         A Metric instance
     """
-    from .utils import list_available_metrics
+    from . import metrics  # noqa — importing the package populates the metrics registry (no-op once cached)
+
+    if name not in metrics_registry:
+        from .utils import list_available_metrics
 
-    available_metrics = list_available_metrics()
-    if name not in available_metrics:
-        raise ValueError(f"Unknown metric name: `{name}`!\nAvailable metric names: {available_metrics}")
+        raise ValueError(f"Unknown metric name: `{name}`!\nAvailable metric names: {list_available_metrics()}")
     config = config or metrics_registry[name].config_class()
     metric = metrics_registry[name].module_class(config, **kwargs)
     return metric
@@ -14,8 +14,8 @@ Examples:
 """
 from __future__ import annotations
 
+import io
 import os
-import tempfile
 from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 from pprint import pformat
@@ -278,18 +278,20 @@ class Config:
             commit_message (str): Push commit message
         """
         path_in_repo = f"{subfolder}/{filename}" if subfolder else filename
-        subfolder = subfolder or ""
 
         # create remote repo
         create_repo(repo_id, repo_type=repo_type, private=private, exist_ok=True)
-        # save to tmp and prepare for push
-        cache_path = tempfile.mkdtemp()
-        config_path = self.save(cache_path, filename=filename, subfolder=subfolder, skip_none_fields=skip_none_fields)
+        # serialize the config in memory and upload the bytes directly, no disk round trip needed
+        config = self.dict()
+        if skip_none_fields:
+            # exclude None items
+            config = {k: v for k, v in config.items() if v is not None}
+        config_buffer = io.BytesIO(OmegaConf.to_yaml(config).encode())
         # push to hub
         if commit_message is None:
             commit_message = f"Hezar: Upload {filename}"
         upload_file(
-            path_or_fileobj=config_path,
+            path_or_fileobj=config_buffer,
             path_in_repo=path_in_repo,
             repo_id=repo_id,
             repo_type=repo_type,
@@ -59,6 +59,9 @@ class Backends(ExplicitEnum):
     SEQEVAL = "seqeval"
     ROUGE = "rouge_score"
     SAFETENSORS = "safetensors"
+    ONNX = "onnx"
+    ONNXRUNTIME = "onnxruntime"
+    HF_TRANSFER = "hf_transfer"
 
 
 class TaskType(ExplicitEnum):
@@ -10,17 +10,18 @@ Examples:
 
 from __future__ import annotations
 
+import mmap
 import os
 import re
 import tempfile
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Mapping, Optional
 
 import torch
-from huggingface_hub import create_repo, hf_hub_download, upload_file
+from huggingface_hub import create_repo, hf_hub_download, upload_folder
 from torch import nn
 
-from ..builders import build_model
 from ..configs import ModelConfig
 from ..constants import (
     DEFAULT_MODEL_CONFIG_FILE,
@@ -56,6 +57,29 @@ losses_mapping = {
 }
 
 
+def _prefetch_file_pages(path: str | os.PathLike):
+    """
+    Force the OS to populate the page cache for a file using `mmap` with `MAP_POPULATE` (Linux only, no-op elsewhere).
+
+    Warming the page cache makes the file read ahead at peak storage bandwidth so the subsequent deserialization in
+    `torch.load`/safetensors hits memory instead of interleaving slow reads with tensor construction.
+
+    Args:
+        path: Path to the file to prefetch
+    """
+    if not hasattr(mmap, "MAP_POPULATE"):
+        return
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                mapped = mmap.mmap(f.fileno(), size, flags=mmap.MAP_SHARED | mmap.MAP_POPULATE, prot=mmap.PROT_READ)
+                mapped.close()
+    except (OSError, ValueError):
+        # Prefetching is purely an optimization, never fail the load because of it
+        pass
+
+
 class Model(nn.Module):
     """
     Base class for all neural network models in Hezar.
@@ -132,6 +156,9 @@ class Model(nn.Module):
         Returns:
             The fully loaded Hezar model
         """
+        # Deferred so importing this module never pays the builders/registry import chain unless `load` is used
+        from ..builders import build_model
+
         # Get device if provided in the kwargs
         device = None or kwargs.pop("device", None)
         # Load config
@@ -162,15 +189,40 @@ class Model(nn.Module):
             model_filename = model_filename.replace(".pt", ".safetensors")
         # does the path exist locally?
         is_local = load_locally or os.path.isdir(hub_or_local_path)
+        preprocessor_future = None
         if not is_local:
-            model_path = hf_hub_download(
-                hub_or_local_path,
-                filename=model_filename,
-                cache_dir=cache_dir,
-                resume_download=True,
-            )
+            if os.getenv("HEZAR_PARALLEL_DOWNLOADING", "0") == "1":
+                # Overlap the HTTPS GETs for the model weights and the preprocessor files. Cold-start loading is
+                # I/O-bound so downloading the files concurrently saturates the connection instead of serializing
+                # the round trips.
+                max_workers = int(os.getenv("HEZAR_PARALLEL_DOWNLOADS", "4"))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    model_path_future = executor.submit(
+                        hf_hub_download,
+                        hub_or_local_path,
+                        filename=model_filename,
+                        cache_dir=cache_dir,
+                        resume_download=True,
+                    )
+                    if load_preprocessor:
+                        preprocessor_future = executor.submit(
+                            Preprocessor.load,
+                            hub_or_local_path,
+                            force_return_dict=True,
+                            cache_dir=cache_dir,
+                        )
+                    model_path = model_path_future.result()
+            else:
+                model_path = hf_hub_download(
+                    hub_or_local_path,
+                    filename=model_filename,
+                    cache_dir=cache_dir,
+                    resume_download=True,
+                )
         else:
             model_path = os.path.join(hub_or_local_path, model_filename)
+        # Warm the page cache for the weights file before deserializing it
+        _prefetch_file_pages(model_path)
         # Get state dict from the model
         if load_safetensors:
             if not is_backend_available(Backends.SAFETENSORS):
@@ -191,7 +243,10 @@ class Model(nn.Module):
             model.save(save_path)
         # Load the preprocessor(s)
         if load_preprocessor:
-            preprocessor = Preprocessor.load(hub_or_local_path, force_return_dict=True, cache_dir=cache_dir)
+            if preprocessor_future is not None:
+                preprocessor = preprocessor_future.result()
+            else:
+                preprocessor = Preprocessor.load(hub_or_local_path, force_return_dict=True, cache_dir=cache_dir)
             model.preprocessor = preprocessor
         return model
 
@@ -312,30 +367,26 @@ class Model(nn.Module):
         # create remote repo
         create_repo(repo_id, repo_type="model", exist_ok=True, private=private)
 
-        # save to tmp and prepare for push
+        # save everything to tmp and push the whole folder in a single commit
         cache_path = tempfile.mkdtemp()
-        self.save(cache_path, filename=filename, config_filename=config_filename)
+        self.save(
+            cache_path,
+            filename=filename,
+            config_filename=config_filename,
+            save_preprocessor=push_preprocessor,
+        )
         if commit_message is None:
             commit_message = "Hezar: Upload model and config"
 
-        # upload config file
-        self.config.push_to_hub(
-            repo_id,
-            filename=config_filename,
-            repo_type="model",
-            commit_message=commit_message,
-        )
-        # upload preprocessor(s)
-        if push_preprocessor:
-            if self.preprocessor is not None:
-                self.preprocessor.push_to_hub(repo_id, commit_message=commit_message, private=private)
+        if is_backend_available(Backends.HF_TRANSFER):
+            # Use the Rust multi-part transfer backend for large LFS files when it's installed
+            os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
-        # upload model file
-        weights_path = os.path.join(cache_path, filename)
-        upload_file(
-            path_or_fileobj=weights_path,
-            path_in_repo=filename,
+        # upload model, config and preprocessor(s) together so the files are transferred concurrently
+        upload_folder(
             repo_id=repo_id,
+            folder_path=cache_path,
+            repo_type="model",
             commit_message=commit_message,
         )
 
@@ -472,7 +523,10 @@ class Model(nn.Module):
     @staticmethod
     def _move_inputs_to_device(inputs, device):
         """
-        Move all input tensors in the inputs to the device
+        Move all input tensors in the inputs to the device.
+
+        CPU tensors headed to a CUDA device are staged through pinned memory so the host-to-device copy is
+        asynchronous and overlaps with kernel launches instead of blocking on pageable memory.
 
         Args:
             inputs: A torch.Tensor or a batch dict that contains tensors in its values
@@ -481,10 +535,17 @@ class Model(nn.Module):
         Returns:
             Same inputs moved to the device
         """
+        device = torch.device(device) if not isinstance(device, torch.device) else device
+
+        def _to_device(tensor: torch.Tensor):
+            if device.type == "cuda" and tensor.device.type == "cpu":
+                return tensor.pin_memory().to(device, non_blocking=True)
+            return tensor.to(device)
+
         if isinstance(inputs, torch.Tensor):
-            inputs = inputs.to(device)
+            inputs = _to_device(inputs)
         elif isinstance(inputs, Mapping):
-            inputs = {k: v.to(device) if isinstance(v, torch.Tensor) else v for k, v in inputs.items()}
+            inputs = {k: _to_device(v) if isinstance(v, torch.Tensor) else v for k, v in inputs.items()}
         else:
             raise ValueError(
                 f"Cannot move inputs of type `{type(inputs)}` to `{device}`. "
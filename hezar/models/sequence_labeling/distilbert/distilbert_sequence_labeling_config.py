@@ -28,3 +28,10 @@ class DistilBertSequenceLabelingConfig(ModelConfig):
     use_cache: bool = True
     classifier_dropout: float = None
     prediction_skip_tokens: list = field(default_factory=lambda: ["[SEP]", "[CLS]"])
+    # Compile the backbone/classifier with `torch.compile` (torch>=2.0) for inference. The first batch pays a
+    # one-time graph capture/warm-up cost, so this is opt-in.
+    compile_inference: bool = False
+    # When set, inference inputs are copied into persistent preallocated tensors of shape
+    # [static_inference_batch_size, max_position_embeddings], giving every forward call stable tensor addresses
+    # (required for CUDA-graph capture under `compile_inference`) and avoiding per-call allocator pressure.
+    static_inference_batch_size: int = None
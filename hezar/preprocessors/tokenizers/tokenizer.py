@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
 from collections import defaultdict
@@ -36,6 +37,27 @@ if is_backend_available(Backends.TOKENIZERS):
 logger = Logger(__name__)
 
 
+def _read_tokenizer_file(path: str) -> str:
+    """
+    Read a `tokenizer.json` file, caching its contents per path.
+
+    Repeated loads of the same file (common when many models are constructed from the same repo in a serving
+    process) then skip the disk read. The cache key includes the file's mtime and size, so overwriting a local
+    `tokenizer.json` (e.g. training then saving into a previously loaded directory) serves the new contents instead
+    of stale ones. Only the raw text is cached — every wrapper still parses its own backend tokenizer instance,
+    because the backend is mutable (padding/truncation state, training, added tokens) and must never be shared
+    between `Tokenizer` instances.
+    """
+    stat = os.stat(path)
+    return _read_file_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 @dataclass
 class TokenizerConfig(PreprocessorConfig):
     """
@@ -78,6 +100,28 @@ class TokenizerConfig(PreprocessorConfig):
     mask_token: str = None
     additional_special_tokens: List[str] = None
 
+    @property
+    def special_tokens(self) -> List[str]:
+        """
+        All special tokens set on this config, for handing to the backend trainers. The pad token comes first so
+        that freshly trained vocabs assign it id 0, matching the models' default `pad_token_id`.
+        """
+        tokens = [
+            self.pad_token,
+            self.bos_token,
+            self.eos_token,
+            self.unk_token,
+            self.sep_token,
+            self.cls_token,
+            self.mask_token,
+        ]
+        tokens = [token for token in tokens if token is not None]
+        if self.additional_special_tokens is not None:
+            for token in self.additional_special_tokens:
+                if token not in tokens:
+                    tokens.append(token)
+        return tokens
+
 
 class Tokenizer(Preprocessor):
     """
@@ -138,7 +182,7 @@ class Tokenizer(Preprocessor):
         Returns:
             HFTokenizer: The created tokenizer.
         """
-        tokenizer = HFTokenizer.from_file(path)
+        tokenizer = HFTokenizer.from_str(_read_tokenizer_file(path))
         return tokenizer
 
     def build(self):
@@ -168,7 +212,58 @@ class Tokenizer(Preprocessor):
         elif isinstance(inputs, list) and is_pretokenized:
             if isinstance(inputs[0], str):
                 inputs = [inputs]
-        return self._tokenizer.encode_batch(inputs, is_pretokenized, add_special_tokens)
+        return self.encode_batch(inputs, is_pretokenized=is_pretokenized, add_special_tokens=add_special_tokens)
+
+    def encode_batch(
+        self,
+        inputs: List,
+        is_pretokenized: bool = False,
+        add_special_tokens: bool = True,
+        sort_by_length: bool = False,
+        bucket_size: int = 32,
+        **kwargs,
+    ):
+        """
+        Tokenize a batch of inputs with a single call to the backend tokenizer.
+
+        Handing the whole batch to the Rust backend releases the GIL and lets the backend parallelize tokenization
+        across the inputs, instead of paying one Python<->Rust round trip per input.
+
+        When `sort_by_length` is enabled, inputs are sorted by their raw length and encoded in buckets of
+        `bucket_size`, so that padding (if enabled on the backend) is applied per bucket rather than against the
+        longest sequence in the whole batch. This keeps the attention cost on models consuming these batches
+        proportional to each bucket's own max length. The returned encodings are always in the original input order.
+
+        Args:
+            inputs: A batch of inputs (raw or pre-tokenized).
+            is_pretokenized: Whether the inputs are already tokenized.
+            add_special_tokens: Whether to add special tokens to the inputs. Defaults to True.
+            sort_by_length: Whether to bucket the inputs by length before encoding to minimize padding waste.
+            bucket_size: Number of inputs per bucket when `sort_by_length` is enabled.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            List of backend `Encoding` objects.
+        """
+        if sort_by_length and len(inputs) > 1:
+            order = sorted(range(len(inputs)), key=lambda index: len(inputs[index]))
+            encodings = [None] * len(inputs)
+            for start in range(0, len(order), bucket_size):
+                bucket = order[start:start + bucket_size]
+                bucket_encodings = self._tokenizer.encode_batch(
+                    [inputs[index] for index in bucket],
+                    is_pretokenized=is_pretokenized,
+                    add_special_tokens=add_special_tokens,
+                )
+                for index, encoding in zip(bucket, bucket_encodings):
+                    encodings[index] = encoding
+            return encodings
+
+        return self._tokenizer.encode_batch(
+            inputs,
+            is_pretokenized=is_pretokenized,
+            add_special_tokens=add_special_tokens,
+        )
 
     def decode(self, ids: List[int], skip_special_tokens: bool = True, **kwargs):
         """
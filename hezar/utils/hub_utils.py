@@ -72,18 +72,10 @@ def exists_on_hub(hub_path: str, repo_type="model"):
     Returns:
         True or False
     """
-    author, repo_name = hub_path.split("/")
-    api = HfApi()
-    if repo_type == "model":
-        paths = list(iter(api.list_models(author=author)))
-    elif repo_type == "dataset":
-        paths = list(iter(api.list_datasets(author=author)))
-    elif repo_type == "space":
-        paths = list(iter(api.list_spaces(author=author)))
-    else:
+    if repo_type not in ("model", "dataset", "space"):
         raise ValueError(f"Unknown type: {repo_type}! Use `model`, `dataset`, `space`, etc.")
-
-    return hub_path in [path.id for path in paths]
+    # A single existence check instead of listing every repo under the author and scanning for the name
+    return HfApi().repo_exists(hub_path, repo_type=repo_type)
 
 
 def clone_repo(repo_id: str, save_path: str, **kwargs):
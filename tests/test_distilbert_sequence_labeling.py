@@ -0,0 +1,58 @@
+import torch
+
+from hezar.models import DistilBertSequenceLabeling, DistilBertSequenceLabelingConfig
+
+
+def _build_model(**kwargs):
+    config = DistilBertSequenceLabelingConfig(
+        num_labels=2,
+        dim=32,
+        n_heads=2,
+        n_layers=1,
+        vocab_size=100,
+        max_position_embeddings=16,
+        **kwargs,
+    )
+    return DistilBertSequenceLabeling(config)
+
+
+def test_inner_config_cache_returns_copies():
+    model_1 = _build_model()
+    model_2 = _build_model()
+    config_1 = model_1._build_inner_config()
+    config_2 = model_2._build_inner_config()
+    assert config_1 is not config_2
+    assert config_1.to_dict() == config_2.to_dict()
+    # Mutating a returned config must not leak into the cache
+    config_1.dim = 999
+    assert model_1._build_inner_config().dim == 32
+
+
+def test_static_buffers_reuse_allocation():
+    model = _build_model(static_inference_batch_size=2)
+    model.eval()
+    token_ids = torch.tensor([[5, 6, 7], [8, 9, 10]], dtype=torch.long)
+    attention_mask = torch.ones_like(token_ids)
+    token_ids_view, attention_mask_view = model._copy_into_static_buffers(token_ids, attention_mask)
+    assert torch.equal(token_ids_view, token_ids)
+    assert torch.equal(attention_mask_view, attention_mask)
+    buffer_ptr = token_ids_view.data_ptr()
+    # A later, differently-shaped batch must land in the same preallocated buffer
+    next_token_ids = torch.tensor([[1, 2]], dtype=torch.long)
+    next_view, _ = model._copy_into_static_buffers(next_token_ids, None)
+    assert next_view.data_ptr() == buffer_ptr
+    assert torch.equal(next_view, next_token_ids)
+
+
+def test_static_buffers_oversize_fallback():
+    model = _build_model(static_inference_batch_size=2)
+    model.eval()
+    # Batch dimension exceeds the configured buffer, inputs must come back untouched
+    oversize_batch = torch.zeros(3, 4, dtype=torch.long)
+    token_ids_out, attention_mask_out = model._copy_into_static_buffers(oversize_batch, None)
+    assert token_ids_out is oversize_batch
+    assert attention_mask_out is None
+    # Sequence dimension exceeds `max_position_embeddings`, same fallback
+    long_sequence = torch.zeros(1, 32, dtype=torch.long)
+    token_ids_out, _ = model._copy_into_static_buffers(long_sequence, None)
+    assert token_ids_out is long_sequence
@@ -0,0 +1,45 @@
+from hezar.preprocessors.tokenizers.wordpiece import WordPieceConfig, WordPieceTokenizer, _batch_iterator
+
+
+TRAIN_TEXTS = [
+    "hezar is a multipurpose ai library",
+    "the quick brown fox jumps over the lazy dog",
+    "tokenizers split raw text into tokens",
+    "training a tokenizer only needs an iterable of texts",
+    "short text",
+    "a",
+]
+
+
+def _train_tokenizer(dataset):
+    tokenizer = WordPieceTokenizer(WordPieceConfig(vocab_size=200, min_frequency=1, show_progress=False))
+    tokenizer.train_from_iterator(dataset)
+    return tokenizer
+
+
+def test_batch_iterator():
+    batches = list(_batch_iterator(iter(range(10)), batch_size=4))
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert list(_batch_iterator([], batch_size=4)) == []
+
+
+def test_train_from_iterator_on_generator():
+    # Generators have no `__len__`, so training must work without an explicit `length`
+    tokenizer = _train_tokenizer(text for text in TRAIN_TEXTS)
+    vocab = tokenizer.get_vocab()
+    # The configured special tokens must make it into the trained vocab, with the pad token at id 0
+    for token in tokenizer.config.special_tokens:
+        assert token in vocab
+    assert vocab[tokenizer.config.pad_token] == 0
+    encodings = tokenizer.encode(TRAIN_TEXTS[0], add_special_tokens=False)
+    assert len(encodings) == 1
+    assert all(token_id in vocab.values() for token_id in encodings[0].ids)
+
+
+def test_encode_batch_sort_by_length_restores_order():
+    tokenizer = _train_tokenizer(TRAIN_TEXTS)
+    # Deliberately unsorted lengths so bucketing actually reorders the inputs internally
+    texts = [TRAIN_TEXTS[1], TRAIN_TEXTS[4], TRAIN_TEXTS[2], TRAIN_TEXTS[5], TRAIN_TEXTS[0]]
+    plain_encodings = tokenizer.encode_batch(texts, add_special_tokens=False)
+    bucketed_encodings = tokenizer.encode_batch(texts, add_special_tokens=False, sort_by_length=True, bucket_size=2)
+    assert [encoding.ids for encoding in bucketed_encodings] == [encoding.ids for encoding in plain_encodings]